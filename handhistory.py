@@ -7,36 +7,54 @@ PokerOK / GGNetwork Hand History Analyzer
 
 import argparse
 import csv
+import functools
 import logging
+import mmap
 import os
 import re
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict, Counter
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Iterable
-from statistics import mean
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Dict, Iterable, Iterator, Tuple, Union
 
 
 # =============================================================
 #                     DATA CLASSES 
 # =============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     seat: int
     name: str
     stack: float
 
 
-@dataclass
-class Action:
-    street: str            # 'preflop' | 'flop' | 'turn' | 'river'
-    actor: str
-    action: str            # fold/call/check/bet/raise/all-in
-    amount: Optional[float]
+# Улицы и действия хранятся малыми int-кодами. VPIP и PFR — маски
+# над битами действий героя на префлопе (1 << код действия).
+STREETS = ("preflop", "flop", "turn", "river")
+ACTIONS = ("folds", "checks", "calls", "bets", "raises", "all-in")
+PREFLOP, FLOP, TURN, RIVER = range(len(STREETS))
+FOLD, CHECK, CALL, BET, RAISE, ALLIN = range(len(ACTIONS))
+STREET_IDS = {name: i for i, name in enumerate(STREETS)}
+ACTION_IDS = {name: i for i, name in enumerate(ACTIONS)}
+VPIP_MASK = (1 << CALL) | (1 << BET) | (1 << RAISE) | (1 << ALLIN)
+PFR_MASK = (1 << BET) | (1 << RAISE) | (1 << ALLIN)
 
 
-@dataclass
+@dataclass(slots=True)
+class Actions:
+    """Действия раздачи колонками (SoA): i-е действие —
+    (street[i], actor[i], action[i], amount[i])."""
+    street: array = field(default_factory=lambda: array("b"))  # код из STREETS
+    actor: array = field(default_factory=lambda: array("H"))   # индекс имени в Hand.actors
+    action: array = field(default_factory=lambda: array("b"))  # код из ACTIONS
+    amount: List[Optional[float]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
 class Hand:
     hand_id: str
     datetime: Optional[str]
@@ -46,103 +64,172 @@ class Hand:
     hero: str
     hero_cards: List[str] = field(default_factory=list)
     players: List[Player] = field(default_factory=list)
-    actions: List[Action] = field(default_factory=list)
+    actions: Actions = field(default_factory=Actions)
+    actors: List[str] = field(default_factory=list)   # имена для Actions.actor
     board: List[str] = field(default_factory=list)
     hero_result: float = 0.0
+    hero_position: str = "UNKNOWN"
 
 
 # =============================================================
 #                     PARSER FUNCTIONS
 # =============================================================
 
-HAND_SPLIT_RE = re.compile(r"^Poker Hand #", re.MULTILINE)
+# Парсер работает с байтами (bytes или mmap) в ASCII-совместимой кодировке:
+# строки декодируются только для извлечённых полей.
+Buffer = Union[bytes, mmap.mmap]
+
+HAND_HEADER = b"Poker Hand #"
+_ACTION_CODES = {name.encode("ascii"): i for name, i in ACTION_IDS.items()}
+
+# Все токены раздачи, включая токены героя, — в одной альтернации;
+# тип найденного токена определяется по m.lastgroup.
+_LINE_TOKENS = (
+    rb"\n[^\S\n]*(?:"
+    rb"\*\*\*(?:(?=.*FLOP)(?P<flop>)|(?=.*TURN)(?P<turn>)|(?=.*RIVER)(?P<river>)|(?P<preflop>))"
+    rb"|(?P<act>(?P<actor>\S+): (?P<action>folds|checks|calls|bets|raises|all-in)(?: \$?(?P<amount>[\d\.]+))?)"
+    rb")"
+)
+_HERO_TOKENS = (
+    rb"|%(hero)s: Card dealt to \S+ \[(?P<hero_cards>\S+ \S+)\]"
+    rb"|%(hero)s collected \$?(?P<won>[\d\.]+)"
+    rb"|%(hero)s lost \$?(?P<lost>[\d\.]+)"
+)
+_TEXT_TOKENS = (
+    rb"|Seat (?P<seat>(?P<seat_no>\d+): (?P<seat_name>\S+) \((?P<seat_stack>[\d\.]+)\))"
+    rb"|Poker Hand #(?P<id>\d+)"
+    rb"|Blinds\s+(?P<stake>(?P<sb>\S+)/(?P<bb>\S+))"
+    rb"|Table(?=\s+(?P<table>.+))"
+    rb"|Board \[(?P<board>.*?)\]"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def hand_token_re(hero: str, encoding: str = "utf-8") -> re.Pattern:
+    """Токенизатор раздачи с токенами героя; кэшируется по (hero, encoding)."""
+    hero_esc = re.escape(hero.encode(encoding, "replace"))
+    return re.compile(_LINE_TOKENS + _HERO_TOKENS % {b"hero": hero_esc} + _TEXT_TOKENS)
+
 
 # VERY LIGHT parser for PokerOK / GG HH — this is an MVP
 # You will extend it for your format variant.
 
-def iter_hand_texts(text: str) -> Iterable[str]:
-    """Разбивает файл на блоки-руки."""
-    parts = HAND_SPLIT_RE.split(text)
-    if not parts or len(parts) <= 1:
-        return
-    for part in parts[1:]:
-        yield "Poker Hand #" + part
-
-
-def parse_hand(hand_text: str, hero_name: str) -> Optional[Hand]:
-    """Парсинг одной раздачи. MVP-парсер."""
+def iter_hand_spans(buf: Buffer) -> Iterable[Tuple[int, int]]:
+    """Разбивает файл на блоки-руки: отдаёт (start, end) без копирования буфера."""
+    marker = b"\n" + HAND_HEADER
+    if buf[:len(HAND_HEADER)] == HAND_HEADER:
+        start = 0
+    else:
+        start = buf.find(marker)
+        if start < 0:
+            return
+        start += 1
+    while True:
+        nxt = buf.find(marker, start)
+        if nxt < 0:
+            yield start, len(buf)
+            return
+        yield start, nxt + 1
+        start = nxt + 1
+
+
+def parse_hand(buf: Buffer, hero_name: str, start: int = 0, end: Optional[int] = None,
+               encoding: str = "utf-8") -> Optional[Hand]:
+    """Парсинг одной раздачи buf[start:end] (bytes или mmap). MVP-парсер."""
+    if end is None:
+        end = len(buf)
     try:
-        # ---------------- HEADER ----------------
-        id_match = re.search(r"Poker Hand #(\d+)", hand_text)
-        table_match = re.search(r"Table\s+(.+)", hand_text)
-        stake_match = re.search(r"Blinds\s+(\S+)/(\S+)", hand_text)
-
-        hand_id = id_match.group(1) if id_match else "UNKNOWN"
-        table = table_match.group(1).strip() if table_match else "UnknownTable"
+        hand_id = None
+        table = None
+        sb = bb = None
+        players = []
+        board = None
+        actions = Actions()
+        actor_ids: Dict[bytes, int] = {}
+        street = None
+        # связанные append колонок Actions
+        add_street = actions.street.append
+        add_actor = actions.actor.append
+        add_action = actions.action.append
+        add_amount = actions.amount.append
+
+        # ---------------- TOKENS ----------------
+        hero_cards = None
+        won = lost = None
+
+        for m in hand_token_re(hero_name, encoding).finditer(buf, start, end):
+            tag = m.lastgroup
+
+            if tag == "act":
+                if street is not None:
+                    actor, action, amount = m.group("actor", "action", "amount")
+                    actor_id = actor_ids.get(actor)
+                    if actor_id is None:
+                        actor_id = actor_ids[actor] = len(actor_ids)
+                    add_street(street)
+                    add_actor(actor_id)
+                    add_action(_ACTION_CODES[action])
+                    add_amount(float(amount) if amount else None)
+
+            elif tag in STREET_IDS:
+                street = STREET_IDS[tag]
+
+            elif tag == "seat":
+                seat, name, stack = m.group("seat_no", "seat_name", "seat_stack")
+                players.append(Player(int(seat), sys.intern(name.decode(encoding, "ignore")), float(stack)))
+
+            elif tag == "id":
+                if hand_id is None:
+                    hand_id = m.group("id").decode("ascii")
+
+            elif tag == "stake":
+                if sb is None:
+                    sb, bb = m.group("sb", "bb")
+                    sb = float(sb.replace(b"$", b""))
+                    bb = float(bb.replace(b"$", b""))
+
+            elif tag == "table":
+                if table is None:
+                    table = m.group("table").strip().decode(encoding, "ignore")
+
+            elif tag == "board":
+                if board is None:
+                    board = m.group("board").decode(encoding, "ignore").split()
+
+            elif tag == "hero_cards":
+                if hero_cards is None:
+                    hero_cards = m.group("hero_cards").decode(encoding, "ignore").split()
+
+            elif tag == "won":
+                if won is None:
+                    won = float(m.group("won"))
+
+            elif tag == "lost":
+                if lost is None:
+                    lost = float(m.group("lost"))
 
-        if stake_match:
-            sb = float(stake_match.group(1).replace("$", ""))
-            bb = float(stake_match.group(2).replace("$", ""))
-        else:
+        # ---------------- HEADER ----------------
+        if hand_id is None:
+            hand_id = "UNKNOWN"
+        if table is None:
+            table = "UnknownTable"
+        if sb is None:
             sb = 0.5
             bb = 1.0
+        if board is None:
+            board = []
 
-        # ---------------- PLAYERS ----------------
-        players = []
-        for seat, name, stack in re.findall(r"Seat (\d+): (\S+) \(([\d\.]+)\)", hand_text):
-            players.append(Player(int(seat), name, float(stack)))
-
-        # ---------------- HERO CARDS ----------------
-        hero_cards = []
-        hero_cards_match = re.search(
-            hero_name + r": Card dealt to \S+ \[(\S+) (\S+)\]", hand_text
-        )
-        if hero_cards_match:
-            hero_cards = [hero_cards_match.group(1), hero_cards_match.group(2)]
-
-        # ---------------- BOARD ----------------
-        board = []
-        board_match = re.search(r"Board \[(.*?)\]", hand_text)
-        if board_match:
-            board = board_match.group(1).split()
-
-        # ---------------- ACTIONS ----------------
-        actions = []
-        street = None
-        for line in hand_text.splitlines():
-            line = line.strip()
-
-            if line.startswith("***"):
-                if "FLOP" in line:
-                    street = "flop"
-                elif "TURN" in line:
-                    street = "turn"
-                elif "RIVER" in line:
-                    street = "river"
-                else:
-                    street = "preflop"
-                continue
-
-            m = re.match(r"(\S+): (folds|checks|calls|bets|raises|all-in)(?: (\$?[\d\.]+))?", line)
-            if m and street:
-                actor = m.group(1)
-                action = m.group(2)
-                amount = m.group(3)
-                if amount:
-                    amount = float(amount.replace("$", ""))
-                actions.append(Action(street, actor, action, amount))
+        if hero_cards is None:
+            hero_cards = []
 
         # ---------------- HERO RESULT ----------------
         result = 0.0
-        win = re.search(hero_name + r" collected \$?([\d\.]+)", hand_text)
-        if win:
-            result += float(win.group(1))
+        if won is not None:
+            result += won
+        if lost is not None:
+            result -= lost
 
-        lose = re.search(hero_name + r" lost \$?([\d\.]+)", hand_text)
-        if lose:
-            result -= float(lose.group(1))
-
-        return Hand(
+        hand = Hand(
             hand_id=hand_id,
             datetime=None,
             table=table,
@@ -152,9 +239,12 @@ def parse_hand(hand_text: str, hero_name: str) -> Optional[Hand]:
             hero_cards=hero_cards,
             players=players,
             actions=actions,
+            actors=[sys.intern(actor.decode(encoding, "ignore")) for actor in actor_ids],
             board=board,
             hero_result=result
         )
+        hand.hero_position = determine_positions(hand).get(hero_name, "UNKNOWN")
+        return hand
     except Exception as e:
         logging.debug(f"Parse error in hand: {e}")
         return None
@@ -164,16 +254,19 @@ def parse_hand(hand_text: str, hero_name: str) -> Optional[Hand]:
 #                     POSITION LOGIC
 # =============================================================
 
+POSITIONS = ("BTN", "SB", "BB", "UTG", "MP", "CO")
+POS_IDS = {name: i for i, name in enumerate(POSITIONS + ("UNKNOWN",))}
+
+
 def determine_positions(hand: Hand) -> Dict[str, str]:
     """Возвращает словарь {player_name -> position}."""
     # MVP: просто определить BTN как seat с наименьшим номером
     if not hand.players:
         return {}
     sorted_players = sorted(hand.players, key=lambda p: p.seat)
-    positions = ["BTN", "SB", "BB", "UTG", "MP", "CO"]
     pos_map = {}
     for i, p in enumerate(sorted_players):
-        pos_map[p.name] = positions[i % len(positions)]
+        pos_map[p.name] = POSITIONS[i % len(POSITIONS)]
     return pos_map
 
 
@@ -181,12 +274,16 @@ def determine_positions(hand: Hand) -> Dict[str, str]:
 #                     STATS AGGREGATOR
 # =============================================================
 
+# Счётчики позиционной статистики: столбцы матрицы pos_stats
+POS_COUNTERS = 5
+POS_HANDS, POS_VPIP, POS_PFR, POS_CBET_FLOP, POS_CBET_TURN = range(POS_COUNTERS)
+
+
 @dataclass
 class StatsAggregator:
     hero: str
-    hands: List[Hand] = field(default_factory=list)
 
-    # aggregated fields
+    # aggregated fields — сами Hand не хранятся, только счётчики и колонки
     total_won_chips: float = 0.0
 
     vpip: int = 0
@@ -209,32 +306,59 @@ class StatsAggregator:
     wsd_wins: int = 0
     saw_flop: int = 0
 
-    pos_stats: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    # сумма bb по раздачам: средний bb за O(1) без прохода по рукам
+    sum_bb: float = 0.0
+
+    # плотная матрица [позиция][счётчик], индексы из POS_IDS и POS_*;
+    # pos_order — позиции в порядке первого появления (порядок отчёта)
+    pos_stats: List[List[int]] = field(default_factory=lambda: [[0] * POS_COUNTERS for _ in POS_IDS])
+    pos_results: List[array] = field(default_factory=lambda: [array("d") for _ in POS_IDS])
+    pos_order: List[int] = field(default_factory=list)
 
     def add_hand(self, hand: Hand):
-        self.hands.append(hand)
         self.hands_count += 1
         self.total_won_chips += hand.hero_result
-
-        positions = determine_positions(hand)
-        hero_pos = positions.get(self.hero, "UNKNOWN")
-        self.pos_stats[hero_pos]["hands"] += 1
+        self.sum_bb += hand.bb
+
+        pid = POS_IDS[hand.hero_position]
+        pos_row = self.pos_stats[pid]
+        if not pos_row[POS_HANDS]:
+            self.pos_order.append(pid)
+        pos_row[POS_HANDS] += 1
+        self.pos_results[pid].append(hand.hero_result)
+
+        # Один проход по действиям: биты действий героя на префлопе
+        # и первые действующие на флопе и тёрне — без временных списков
+        preflop_bits = 0
+        first_flop_actor = first_turn_actor = None
+        try:
+            hero_id = hand.actors.index(self.hero)
+        except ValueError:
+            hero_id = -1
+        acts = hand.actions
+        for street, actor, action in zip(acts.street, acts.actor, acts.action):
+            if street == PREFLOP:
+                if actor == hero_id:
+                    preflop_bits |= 1 << action
+            elif street == FLOP:
+                if first_flop_actor is None:
+                    first_flop_actor = actor
+            elif street == TURN:
+                if first_turn_actor is None:
+                    first_turn_actor = actor
 
         # VPIP / PFR
-        preflop_actions = [a for a in hand.actions if a.street == "preflop" and a.actor == self.hero]
-        did_vpip = any(a.action in ("calls", "raises", "bets", "all-in") for a in preflop_actions)
-        did_pfr = any(a.action in ("raises", "bets", "all-in") for a in preflop_actions)
-
+        did_vpip = preflop_bits & VPIP_MASK
+        did_pfr = preflop_bits & PFR_MASK
         if did_vpip:
             self.vpip += 1
-            self.pos_stats[hero_pos]["vpip"] += 1
+            pos_row[POS_VPIP] += 1
         if did_pfr:
             self.pfr += 1
-            self.pos_stats[hero_pos]["pfr"] += 1
+            pos_row[POS_PFR] += 1
 
         # Flop C-bet
-        flop_actions = [a for a in hand.actions if a.street == "flop"]
-        if flop_actions:
+        if first_flop_actor is not None:
             self.saw_flop += 1
 
         # WTSD / W$SD (MVP)
@@ -244,21 +368,31 @@ class StatsAggregator:
                 self.wsd_wins += 1
 
         # Flop C-bet opportunity (if hero was PFR)
-        if did_pfr and flop_actions:
+        if did_pfr and first_flop_actor is not None:
             self.cbet_flop_opportunities += 1
-            first_flop_actor = flop_actions[0].actor
-            if first_flop_actor == self.hero:
+            if first_flop_actor == hero_id:
                 self.cbet_flop += 1
-                self.pos_stats[hero_pos]["cbet_flop"] += 1
+                pos_row[POS_CBET_FLOP] += 1
 
         # Turn C-bet opportunity
-        turn_actions = [a for a in hand.actions if a.street == "turn"]
-        if did_pfr and turn_actions:
+        if did_pfr and first_turn_actor is not None:
             self.cbet_turn_opportunities += 1
-            first_turn_actor = turn_actions[0].actor
-            if first_turn_actor == self.hero:
+            if first_turn_actor == hero_id:
                 self.cbet_turn += 1
-                self.pos_stats[hero_pos]["cbet_turn"] += 1
+                pos_row[POS_CBET_TURN] += 1
+
+    def merge(self, other: "StatsAggregator"):
+        """Добавляет счётчики другого агрегатора (например, из процесса пула)."""
+        for f in fields(self):
+            if f.type in (int, float):
+                setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+        for pid in other.pos_order:
+            pos_row = self.pos_stats[pid]
+            if not pos_row[POS_HANDS]:
+                self.pos_order.append(pid)
+            for i, n in enumerate(other.pos_stats[pid]):
+                pos_row[i] += n
+            self.pos_results[pid].extend(other.pos_results[pid])
 
     # ---------------- STATS COMPUTATION ----------------
 
@@ -286,29 +420,28 @@ class StatsAggregator:
 
         # bb/100
         # MVP approach: bb average over all hands
-        avg_bb = mean([h.bb for h in self.hands]) if self.hands else 1
+        avg_bb = self.sum_bb / self.hands_count if self.hands_count else 1
         stats["bb_per_100"] = round(self.total_won_chips / avg_bb * 100 / total, 2)
 
         return stats
 
     def compute_positional(self):
         pos_output = {}
-        for pos, cnt in self.pos_stats.items():
-            hands = cnt.get("hands", 0)
-            if hands == 0:
-                continue
-            vp = cnt.get("vpip", 0) / hands * 100
-            pf = cnt.get("pfr", 0) / hands * 100
-            cbf = cnt.get("cbet_flop", 0) / (cnt.get("cbet_flop_opportunities", hands) or 1) * 100
+        avg_bb = self.sum_bb / self.hands_count if self.hands_count else 1
+        names = list(POS_IDS)
+        for pid in self.pos_order:
+            cnt = self.pos_stats[pid]
+            hands = cnt[POS_HANDS]
+            vp = cnt[POS_VPIP] / hands * 100
+            pf = cnt[POS_PFR] / hands * 100
 
             # bb/100 by position — simplified
-            results = [h.hero_result for h in self.hands if determine_positions(h).get(self.hero) == pos]
+            results = self.pos_results[pid]
             bb100 = 0.0
             if results:
-                avg_bb = mean([h.bb for h in self.hands])
                 bb100 = sum(results) / avg_bb * 100 / len(results)
 
-            pos_output[pos] = {
+            pos_output[names[pid]] = {
                 "hands": hands,
                 "vpip_pct": round(vp, 2),
                 "pfr_pct": round(pf, 2),
@@ -321,20 +454,24 @@ class StatsAggregator:
 #                     CSV EXPORT
 # =============================================================
 
+CSV_BUFFER = 1 << 20
+
+
 def save_csv_global(path, stats):
-    with open(path, "w", newline="", encoding="utf-8") as f:
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER) as f:
         writer = csv.writer(f)
         writer.writerow(["metric", "value"])
-        for k, v in stats.items():
-            writer.writerow([k, v])
+        writer.writerows(stats.items())
 
 
 def save_csv_positions(path, pos_stats):
-    with open(path, "w", newline="", encoding="utf-8") as f:
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER) as f:
         writer = csv.writer(f)
         writer.writerow(["position", "hands", "vpip_pct", "pfr_pct", "bb_per_100"])
-        for pos, data in pos_stats.items():
-            writer.writerow([pos, data["hands"], data["vpip_pct"], data["pfr_pct"], data["bb_per_100"]])
+        writer.writerows(
+            (pos, data["hands"], data["vpip_pct"], data["pfr_pct"], data["bb_per_100"])
+            for pos, data in pos_stats.items()
+        )
 
 
 # =============================================================
@@ -375,41 +512,156 @@ def find_files(path: Path) -> List[Path]:
     return [f for f in path.rglob("*") if f.is_file() and f.suffix in (".txt", ".log")]
 
 
+# =============================================================
+#                     FILE PARSING
+# =============================================================
+
+READ_AHEAD = 64
+
+
+def buffer_encoding(encoding: str) -> str:
+    """Кодировка буфера для парсера: ASCII-несовместимые файлы перекодируются в utf-8."""
+    if HAND_HEADER.decode("ascii").encode(encoding) == HAND_HEADER:
+        return encoding
+    return "utf-8"
+
+
+def read_file(filepath: Path, encoding: str = "utf-8") -> Optional[Buffer]:
+    """Отображает HH-файл в память (mmap); при ошибке возвращает None."""
+    try:
+        if buffer_encoding(encoding) != encoding:
+            with open(filepath, "r", encoding=encoding, errors="ignore") as f:
+                return f.read().encode("utf-8")
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception as e:
+        logging.warning(f"Error reading file {filepath}: {e}")
+        return None
+
+
+def close_buffer(buf: Optional[Buffer]):
+    if isinstance(buf, mmap.mmap):
+        buf.close()
+
+
+def read_all(paths: Iterable[Path], encoding: str = "utf-8", window: int = READ_AHEAD) -> Iterator[Tuple[Path, Optional[Buffer]]]:
+    """Отдаёт (path, buffer) по порядку, открывая файлы наперёд; буфер закрывается после итерации."""
+    if buffer_encoding(encoding) != encoding:
+        # перекодированный файл читается целиком сразу — наперёд не держим
+        window = 1
+    paths = iter(paths)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < window:
+                filepath = next(paths, None)
+                if filepath is None:
+                    break
+                buf = read_file(filepath, encoding)
+                if isinstance(buf, mmap.mmap) and hasattr(mmap, "MADV_WILLNEED"):
+                    buf.madvise(mmap.MADV_WILLNEED)
+                pending.append((filepath, buf))
+            if not pending:
+                return
+            filepath, buf = pending.popleft()
+            try:
+                yield filepath, buf
+            finally:
+                close_buffer(buf)
+    finally:
+        for _, buf in pending:
+            close_buffer(buf)
+
+
+def parse_buffer(buf: Buffer, hero: str, encoding: str = "utf-8") -> List[Hand]:
+    """Парсит раздачи из буфера одного файла, в которых встречается герой."""
+    if buf.find(b"\n") < 0 and buf.find(b"\r") >= 0:
+        # переводы строк только \r (старый Mac): приводим к \n, как universal newlines
+        buf = buf[:].replace(b"\r", b"\n")
+    hands = []
+    hero_bytes = hero.encode(encoding, "replace")
+    for start, end in iter_hand_spans(buf):
+        # раздача без имени героя не меняет его статистику — не парсим её
+        if buf.find(hero_bytes, start, end) == -1:
+            continue
+        hand = parse_hand(buf, hero, start, end, encoding)
+        if hand:
+            hands.append(hand)
+        else:
+            logging.debug("Hand parsing failed")
+    return hands
+
+
+def parse_file(filepath: Path, hero: str, encoding: str = "utf-8") -> List[Hand]:
+    """Читает и парсит один HH-файл."""
+    buf = read_file(filepath, encoding)
+    if buf is None:
+        return []
+    try:
+        return parse_buffer(buf, hero, buffer_encoding(encoding))
+    finally:
+        close_buffer(buf)
+
+
+def aggregate_file(filepath: Path, hero: str, encoding: str = "utf-8") -> StatsAggregator:
+    """Парсит один HH-файл и возвращает его счётчики. Выполняется в процессах пула."""
+    aggregator = StatsAggregator(hero=hero)
+    for hand in parse_file(filepath, hero, encoding):
+        aggregator.add_hand(hand)
+    return aggregator
+
+
 # =============================================================
 #                     MAIN
 # =============================================================
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(description="PokerOK / GGNetwork hand history analyzer")
     parser.add_argument("--path", required=True, help="Path to HH file or directory")
     parser.add_argument("--hero", default="Hero", help="Hero name")
     parser.add_argument("--output-prefix", default=None, help="Prefix for CSV output")
     parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--workers", type=positive_int, default=None, help="Number of parser processes (default: CPU count)")
     parser.add_argument("--verbose", action="store_true")
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
 
+    try:
+        encoding = buffer_encoding(args.encoding)
+    except LookupError:
+        parser.error(f"unknown encoding: {args.encoding}")
+
     path = Path(args.path)
     files = find_files(path)
     logging.info(f"Found {len(files)} files")
 
     aggregator = StatsAggregator(hero=args.hero)
 
-    for filepath in files:
-        try:
-            with open(filepath, "r", encoding=args.encoding, errors="ignore") as f:
-                text = f.read()
-        except Exception as e:
-            logging.warning(f"Error reading file {filepath}: {e}")
-            continue
-
-        for block in iter_hand_texts(text):
-            hand = parse_hand(block, args.hero)
-            if hand:
-                aggregator.add_hand(hand)
-            else:
-                logging.debug("Hand parsing failed")
+    # Файлы независимы: каждый процесс пула агрегирует свои файлы,
+    # главный процесс только сливает счётчики
+    workers = min(args.workers or os.cpu_count() or 1, len(files))
+    if workers > 1:
+        aggregate = functools.partial(aggregate_file, hero=args.hero, encoding=args.encoding)
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for part in executor.map(aggregate, files, chunksize=chunksize):
+                aggregator.merge(part)
+    else:
+        # без пула следующие файлы подгружаются ядром параллельно с парсингом
+        for _, buf in read_all(files, args.encoding):
+            if buf is not None:
+                for hand in parse_buffer(buf, args.hero, encoding):
+                    aggregator.add_hand(hand)
 
     stats = aggregator.compute()
     pos_stats = aggregator.compute_positional()